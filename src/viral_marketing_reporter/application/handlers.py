@@ -46,11 +46,18 @@ class CreateSearchCommandHandler:
     async def handle(self, command: CreateSearchCommand):
         with logger.contextualize(job_id=command.job_id):
             logger.debug(f"Handling CreateSearchCommand for job {command.job_id}.")
+            # 같은 URL 목록을 가진 태스크들은 하나의 Post 튜플을 공유합니다.
+            posts_by_urls: dict[tuple[str, ...], tuple[Post, ...]] = {}
+            for dto in command.tasks:
+                urls = tuple(dto.urls)
+                if urls not in posts_by_urls:
+                    posts_by_urls[urls] = tuple(Post(url=url) for url in urls)
+
             tasks = [
                 SearchTask(
                     index=dto.index,
                     keyword=Keyword(text=dto.keyword),
-                    blog_posts_to_find=[Post(url=url) for url in dto.urls],
+                    blog_posts_to_find=posts_by_urls[tuple(dto.urls)],
                     platform=dto.platform,
                     screenshot_all_posts=dto.screenshot_all_posts,
                 )
@@ -250,7 +257,7 @@ class GetJobResultQueryHandler:
                     logger.warning(f"Job {query.job_id} not found in query handler.")
                     return None
 
-                task_dtos = [
+                task_dtos = tuple(
                     TaskResultDTO(
                         keyword=task.keyword.text,
                         status=task.status.value,
@@ -265,7 +272,7 @@ class GetJobResultQueryHandler:
                         error_message=task.error_message,
                     )
                     for task in job.tasks
-                ]
+                )
                 logger.debug(
                     f"Returning DTO for job {query.job_id} with {len(task_dtos)} tasks."
                 )
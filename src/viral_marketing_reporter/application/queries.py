@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 import uuid
 
 # 1. Queries
@@ -23,4 +24,18 @@ class TaskResultDTO:
 class JobResultDTO:
     job_id: uuid.UUID
     status: str
-    tasks: list[TaskResultDTO]
+    tasks: tuple[TaskResultDTO, ...]
+
+    @cached_property
+    def columns(
+        self,
+    ) -> tuple[
+        tuple[str, ...], tuple[str, ...], tuple[str | None, ...], tuple[str | None, ...]
+    ]:
+        """태스크 결과를 (키워드, 상태, 스크린샷 경로, 에러 메시지) 열 단위로 반환합니다."""
+        return (
+            tuple(t.keyword for t in self.tasks),
+            tuple(t.status for t in self.tasks),
+            tuple(t.screenshot_path for t in self.tasks),
+            tuple(t.error_message for t in self.tasks),
+        )
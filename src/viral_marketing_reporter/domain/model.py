@@ -21,32 +21,32 @@ class Platform(Enum):
     INSTAGRAM = "instagram"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Keyword:
     """검색 키워드를 나타내는 Value Object"""
 
     text: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Post:
     """게시물 URL을 나타내는 Value Object"""
 
     url: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Screenshot:
     """스크린샷 파일 경로를 나타내는 Value Object"""
 
     file_path: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """개별 검색 작업의 결과를 담는 Value Object"""
 
-    found_posts: list[Post]
+    found_posts: tuple[Post, ...]
     screenshot: Screenshot | None
 
 
@@ -70,13 +70,13 @@ class JobStatus(Enum):
 # --- Entities & Aggregate Root ---
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class SearchTask:
     """하나의 키워드에 대한 검색 작업을 나타내는 Entity"""
 
     index: int
     keyword: Keyword
-    blog_posts_to_find: list[Post]
+    blog_posts_to_find: tuple[Post, ...]
     platform: Platform
     screenshot_all_posts: bool = False
     status: TaskStatus = TaskStatus.PENDING
@@ -105,7 +105,7 @@ class SearchTask:
         return hash(self.task_id)
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class SearchJob:
     """여러 SearchTask를 포함하는 Aggregate Root."""
 
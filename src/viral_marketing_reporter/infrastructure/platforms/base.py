@@ -9,7 +9,7 @@ class SearchPlatformService(Protocol):
         self,
         index: int,
         keyword: Keyword,
-        posts_to_find: list[Post],
+        posts_to_find: tuple[Post, ...],
         output_dir: Path,
         screenshot_all_posts: bool = False,
     ) -> SearchResult:
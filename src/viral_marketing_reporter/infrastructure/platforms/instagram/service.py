@@ -45,7 +45,7 @@ class PlaywrightInstagramService(SearchPlatformService):
         return match.group(2) if match else None
 
     async def _get_matching_post_if_found(
-        self, post_link: Locator, posts_to_find: list[Post]
+        self, post_link: Locator, posts_to_find: tuple[Post, ...]
     ) -> Post | None:
         """포스트 링크가 찾아야 할 포스트 목록에 있는지 확인합니다."""
         href = await post_link.get_attribute("href")
@@ -75,7 +75,7 @@ class PlaywrightInstagramService(SearchPlatformService):
         self,
         index: int,
         keyword: Keyword,
-        posts_to_find: list[Post],
+        posts_to_find: tuple[Post, ...],
         output_dir: Path,
         screenshot_all_posts: bool = False,
     ) -> SearchResult:
@@ -107,7 +107,7 @@ class PlaywrightInstagramService(SearchPlatformService):
                         event_name="result_not_found",
                     )
                     tracker.end()
-                    return SearchResult(found_posts=[], screenshot=None)
+                    return SearchResult(found_posts=(), screenshot=None)
 
                 top_9_posts = await search_page.get_top_9_posts()
                 tracker.checkpoint("top_9_posts_retrieved")
@@ -129,7 +129,7 @@ class PlaywrightInstagramService(SearchPlatformService):
                         path=(output_dir / f"{keyword.text}_error.png")
                     )
                     tracker.end()
-                    return SearchResult(found_posts=[], screenshot=None)
+                    return SearchResult(found_posts=(), screenshot=None)
 
                 # 상위 9개 포스트에서 찾아야 할 URL이 있는지 확인
                 logger.debug(
@@ -144,9 +144,9 @@ class PlaywrightInstagramService(SearchPlatformService):
                 matching_results = await asyncio.gather(*tasks)
                 tracker.checkpoint("posts_matched")
 
-                found_posts_in_top9: list[Post] = [
+                found_posts_in_top9: tuple[Post, ...] = tuple(
                     post for post in matching_results if post
-                ]
+                )
                 elements_to_highlight: list[Locator] = [
                     top_9_posts[i] for i, post in enumerate(matching_results) if post
                 ]
@@ -89,7 +89,7 @@ class PlaywrightNaverBlogService(SearchPlatformService):
         return {most_common_url}
 
     async def _get_matching_post_if_found(
-        self, post_element: Locator, posts_to_find: list[Post]
+        self, post_element: Locator, posts_to_find: tuple[Post, ...]
     ) -> Post | None:
         """하나의 포스트 요소에서 찾아야 할 Post 객체가 있는지 확인합니다."""
         resolved_urls = await self._resolve_post_urls(post_element)
@@ -104,7 +104,7 @@ class PlaywrightNaverBlogService(SearchPlatformService):
         self,
         index: int,
         keyword: Keyword,
-        posts_to_find: list[Post],
+        posts_to_find: tuple[Post, ...],
         output_dir: Path,
         screenshot_all_posts: bool = False,
     ) -> SearchResult:
@@ -136,7 +136,7 @@ class PlaywrightNaverBlogService(SearchPlatformService):
                         event_name="result_not_found",
                     )
                     tracker.end()
-                    return SearchResult(found_posts=[], screenshot=None)
+                    return SearchResult(found_posts=(), screenshot=None)
 
                 top_10_posts = await search_page.get_top_10_posts()
                 tracker.checkpoint("top_10_posts_retrieved")
@@ -158,7 +158,7 @@ class PlaywrightNaverBlogService(SearchPlatformService):
                         path=(output_dir / f"{keyword.text}_error.png")
                     )
                     tracker.end()
-                    return SearchResult(found_posts=[], screenshot=None)
+                    return SearchResult(found_posts=(), screenshot=None)
 
                 logger.debug(
                     "포스트 매칭 시작",
@@ -172,9 +172,9 @@ class PlaywrightNaverBlogService(SearchPlatformService):
                 matching_results = await asyncio.gather(*tasks)
                 tracker.checkpoint("posts_matched")
 
-                found_posts_in_top10: list[Post] = [
+                found_posts_in_top10: tuple[Post, ...] = tuple(
                     post for post in matching_results if post
-                ]
+                )
                 elements_to_highlight: list[Locator] = [
                     top_10_posts[i] for i, post in enumerate(matching_results) if post
                 ]
@@ -1,7 +1,7 @@
-import webbrowser
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QUrl, Signal, Slot
+from PySide6.QtGui import QBrush, QDesktopServices, QFont
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -16,6 +16,44 @@ from PySide6.QtWidgets import (
 from viral_marketing_reporter.application.queries import JobResultDTO
 from viral_marketing_reporter.domain.model import TaskStatus
 
+_FOUND, _NOT_FOUND, _ERROR = (
+    TaskStatus.FOUND.value,
+    TaskStatus.NOT_FOUND.value,
+    TaskStatus.ERROR.value,
+)
+
+_BLUE = QBrush(Qt.GlobalColor.blue)
+_RED = QBrush(Qt.GlobalColor.red)
+
+# 대화상자를 열 때 바로 표시할 최대 행 수
+_INITIAL_ROW_LIMIT = 500
+
+# 태스크 상태 값 -> (표시 텍스트, 글자색)
+_STATUS_STYLE: dict[str, tuple[str, QBrush]] = {
+    _FOUND: ("포함", _BLUE),
+    _NOT_FOUND: ("미포함", _RED),
+    _ERROR: ("에러 발생", _RED),
+}
+
+
+class ExistenceProbeSignals(QObject):
+    """ExistenceProbe의 결과를 GUI 스레드로 전달하는 시그널"""
+
+    # {행 번호: 파일 존재 여부}
+    finished = Signal(object)
+
+
+class ExistenceProbe(QRunnable):
+    """스레드 풀에서 스크린샷 파일의 존재 여부를 확인하는 작업"""
+
+    def __init__(self, paths: list[tuple[int, Path]]):
+        super().__init__()
+        self.paths = paths
+        self.signals = ExistenceProbeSignals()
+
+    def run(self):
+        self.signals.finished.emit({row: path.exists() for row, path in self.paths})
+
 
 class ResultsDialog(QDialog):
     """검색 결과를 모달 대화상자로 표시하는 위젯"""
@@ -30,8 +68,13 @@ class ResultsDialog(QDialog):
         super().__init__(parent)
         self.result_dto = result_dto
         self.screenshot_folder: Path | None = None
+        self._screenshot_exists: dict[int, bool] = {}
+        self.show_remaining_button: QPushButton | None = None
+
+        # 행마다 새로 만들지 않도록 폰트를 미리 생성합니다.
+        self._underlined_font = QFont()
+        self._underlined_font.setUnderline(True)
         self.setWindowTitle("검색 결과")
-        self.setMinimumSize(800, 400)
 
         layout = QVBoxLayout(self)
 
@@ -40,13 +83,28 @@ class ResultsDialog(QDialog):
         self.results_table.setHorizontalHeaderLabels(
             ["키워드", "상위 노출 포함 여부", "스크린샷"]
         )
-        self.results_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.Stretch
-        )
         self.results_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # 읽기 전용 테이블이므로 다중 선택 시 선택 인덱스 전체를 다시 계산하지 않도록 합니다.
+        self.results_table.setSelectionMode(
+            QTableWidget.SelectionMode.SingleSelection
+        )
         self.results_table.cellClicked.connect(self.open_screenshot)
 
-        self.populate_results()
+        # 행을 채우는 동안 다시 그리지 않고, 크기 관련 설정은 채운 뒤에 적용합니다.
+        viewport = self.results_table.viewport()
+        viewport.setUpdatesEnabled(False)
+        try:
+            self.populate_results()
+        finally:
+            viewport.setUpdatesEnabled(True)
+
+        # Stretch 모드는 모든 셀 내용을 측정해 열 너비를 계산하므로 고정 너비를 사용하고,
+        # 남는 공간은 셀 측정 없이 마지막 열이 채우도록 합니다.
+        header = self.results_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
+        self.results_table.setColumnWidth(0, 200)
+        self.results_table.setColumnWidth(1, 120)
 
         layout.addWidget(self.results_table)
 
@@ -66,53 +124,119 @@ class ResultsDialog(QDialog):
         self.button_box.addButton(
             self.open_folder_button, QDialogButtonBox.ButtonRole.ActionRole
         )
+
+        remaining = len(self.result_dto.tasks) - self.results_table.rowCount()
+        if remaining > 0:
+            self.show_remaining_button = QPushButton(f"나머지 {remaining}개 표시")
+            self.show_remaining_button.clicked.connect(self.show_remaining_results)
+            self.button_box.addButton(
+                self.show_remaining_button, QDialogButtonBox.ButtonRole.ActionRole
+            )
         self.button_box.addButton("OK", QDialogButtonBox.ButtonRole.AcceptRole)
         self.button_box.accepted.connect(self.accept)
         layout.addWidget(self.button_box)
 
+        self.setMinimumSize(800, 400)
+
     def populate_results(self):
-        """결과 DTO를 사용하여 테이블을 채웁니다."""
-        self.results_table.setRowCount(len(self.result_dto.tasks))
-        for row, task in enumerate(self.result_dto.tasks):
-            keyword_item = QTableWidgetItem(task.keyword)
-            status_item = QTableWidgetItem()
-
-            if task.status == TaskStatus.FOUND.value:
-                status_item.setText("포함")
-                status_item.setForeground(Qt.GlobalColor.blue)
-            elif task.status == TaskStatus.NOT_FOUND.value:
-                status_item.setText("미포함")
-                status_item.setForeground(Qt.GlobalColor.red)
-            elif task.status == TaskStatus.ERROR.value:
-                error_msg = task.error_message or "알 수 없는 오류"
-                status_item.setText(f"에러 발생")
-                status_item.setToolTip(error_msg)
-                status_item.setForeground(Qt.GlobalColor.red)
-
-            screenshot_item = QTableWidgetItem(task.screenshot_path or "N/A")
-            if task.screenshot_path:
-                if self.screenshot_folder is None:
-                    self.screenshot_folder = Path(task.screenshot_path).parent
-
-                font = screenshot_item.font()
-                font.setUnderline(True)
-                screenshot_item.setFont(font)
-                screenshot_item.setForeground(Qt.GlobalColor.blue)
+        """결과 DTO를 사용하여 테이블을 채웁니다.
+
+        결과가 많으면 처음 _INITIAL_ROW_LIMIT개만 표시하고,
+        나머지는 show_remaining_results에서 채웁니다.
+        """
+        _, _, screenshot_paths, _ = self.result_dto.columns
+        first_screenshot = next((p for p in screenshot_paths if p), None)
+        self.screenshot_folder = (
+            Path(first_screenshot).parent if first_screenshot else None
+        )
+
+        self._populate_rows(0, min(len(self.result_dto.tasks), _INITIAL_ROW_LIMIT))
+
+    def _populate_rows(self, start: int, end: int):
+        """[start, end) 범위의 태스크 결과로 테이블 행을 채웁니다."""
+        self.results_table.setRowCount(end)
+        keywords, statuses, screenshot_paths, error_messages = self.result_dto.columns
+        paths_to_probe: list[tuple[int, Path]] = []
+        for row, (keyword, status, screenshot_path_str, error_message) in enumerate(
+            zip(
+                keywords[start:end],
+                statuses[start:end],
+                screenshot_paths[start:end],
+                error_messages[start:end],
+                strict=True,
+            ),
+            start=start,
+        ):
+            keyword_item = QTableWidgetItem(keyword)
+
+            style = _STATUS_STYLE.get(status)
+            if style:
+                text, brush = style
+                status_item = QTableWidgetItem(text)
+                status_item.setForeground(brush)
+                if status == _ERROR:
+                    status_item.setToolTip(error_message or "알 수 없는 오류")
+            else:
+                status_item = QTableWidgetItem()
+
+            screenshot_item = QTableWidgetItem(screenshot_path_str or "N/A")
+            if screenshot_path_str:
+                screenshot_path = Path(screenshot_path_str)
+                screenshot_item.setData(Qt.ItemDataRole.UserRole, screenshot_path)
+                paths_to_probe.append((row, screenshot_path))
 
             self.results_table.setItem(row, 0, keyword_item)
             self.results_table.setItem(row, 1, status_item)
             self.results_table.setItem(row, 2, screenshot_item)
 
+        # 파일 확인(stat)으로 GUI 스레드가 멈추지 않도록 스레드 풀에서 처리합니다.
+        if paths_to_probe:
+            probe = ExistenceProbe(paths_to_probe)
+            probe.signals.finished.connect(self._apply_screenshot_existence)
+            QThreadPool.globalInstance().start(probe)
+
+    @Slot(object)
+    def _apply_screenshot_existence(self, results: dict[int, bool]):
+        """존재가 확인된 스크린샷 셀에만 링크 스타일을 적용합니다."""
+        self._screenshot_exists.update(results)
+        for row, exists in results.items():
+            item = self.results_table.item(row, 2)
+            if exists and item:
+                item.setFont(self._underlined_font)
+                item.setForeground(_BLUE)
+
+    @Slot()
+    def show_remaining_results(self):
+        """아직 표시하지 않은 나머지 결과 행을 추가합니다."""
+        self.results_table.setUpdatesEnabled(False)
+        try:
+            self._populate_rows(
+                self.results_table.rowCount(), len(self.result_dto.tasks)
+            )
+        finally:
+            self.results_table.setUpdatesEnabled(True)
+
+        if self.show_remaining_button:
+            self.show_remaining_button.hide()
+
     @Slot(int, int)
     def open_screenshot(self, row: int, column: int):
-        if column == 2:
-            item = self.results_table.item(row, column)
-            if item and item.text() != "N/A":
-                file_path = Path(item.text())
-                if file_path.exists():
-                    webbrowser.open(file_path.as_uri())
+        if column != 2:
+            return
+        item = self.results_table.item(row, column)
+        if item is None:
+            return
+        file_path: Path | None = item.data(Qt.ItemDataRole.UserRole)
+        if file_path is None:
+            return
+        # 백그라운드 확인이 끝나지 않았다면 직접 확인하고 결과를 저장합니다.
+        exists = self._screenshot_exists.get(row)
+        if exists is None:
+            exists = self._screenshot_exists[row] = file_path.exists()
+        if exists:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(str(file_path)))
 
     @Slot()
     def open_screenshot_folder(self):
         if self.screenshot_folder and self.screenshot_folder.exists():
-            webbrowser.open(self.screenshot_folder.as_uri())
\ No newline at end of file
+            QDesktopServices.openUrl(QUrl.fromLocalFile(str(self.screenshot_folder)))
\ No newline at end of file
@@ -17,29 +17,32 @@ class PastingTableWidget(QTableWidget):
         clipboard = QApplication.clipboard()
         text = clipboard.text()
 
-        rows = text.strip().split("\n")
+        # splitlines()는 엑셀의 \r\n 줄바꿈도 처리하므로 셀에 \r이 남지 않습니다.
+        rows = text.rstrip("\r\n").splitlines()
         if not rows:
             return
 
+        # 탭으로 열을 구분합니다.
+        parsed = [row_text.split("\t") for row_text in rows]
+
         # 붙여넣기를 시작할 셀을 가져옵니다.
         start_row = self.currentRow()
         start_col = self.currentColumn()
-
-        for i, row_text in enumerate(rows):
-            # 탭으로 열을 구분합니다.
-            columns = row_text.split("\t")
-            current_row = start_row + i
-
-            # 행이 부족하면 새로 추가합니다.
-            if current_row >= self.rowCount():
-                self.insertRow(current_row)
-
-            for j, cell_text in enumerate(columns):
-                current_col = start_col + j
-                if current_col < self.columnCount():
+        max_cols = self.columnCount() - start_col
+
+        # 행이 부족하면 한 번에 필요한 만큼 추가합니다.
+        needed_rows = start_row + len(parsed)
+        if needed_rows > self.rowCount():
+            self.setRowCount(needed_rows)
+
+        self.setUpdatesEnabled(False)
+        try:
+            for i, columns in enumerate(parsed):
+                current_row = start_row + i
+                # 테이블 범위를 벗어나는 열은 미리 잘라냅니다.
+                for j, cell_text in enumerate(columns[:max_cols]):
                     self.setItem(
-                        current_row,
-                        current_col,
-                        QTableWidgetItem(cell_text)
+                        current_row, start_col + j, QTableWidgetItem(cell_text)
                     )
-
+        finally:
+            self.setUpdatesEnabled(True)
@@ -23,10 +23,10 @@ async def run_test():
 
     # 테스트 데이터
     keyword = Keyword(text="이천데이트")
-    posts_to_find = [
+    posts_to_find = (
         Post(url="https://www.instagram.com/p/C7jcvNiP02_/"),  # 3번째 포스트
         Post(url="https://www.instagram.com/p/DAk8sbeSsGw/"),  # 6번째 포스트
-    ]
+    )
     output_dir = Path.home() / "Downloads" / "viral-reporter" / "instagram" / "test"
 
     print(f"\n검색 키워드: {keyword.text}")
@@ -1,8 +1,6 @@
 import uuid
 from pathlib import Path
 
-import pytest
-
 from viral_marketing_reporter import bootstrap
 from viral_marketing_reporter.application.commands import CreateSearchCommand, TaskDTO
 from viral_marketing_reporter.domain.model import JobStatus, Platform, TaskStatus
@@ -19,7 +17,6 @@ from viral_marketing_reporter.infrastructure.uow import InMemoryUnitOfWork
 SCREENSHOT_DIR = Path(__file__).parent.parent / "screenshots"
 
 
-@pytest.mark.asyncio
 async def test_e2e_full_process_with_mixed_results():
     bus = InMemoryMessageBus()
     uow = InMemoryUnitOfWork(bus)
@@ -1,4 +1,4 @@
-import re
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 
 import pytest
@@ -11,21 +11,65 @@ from viral_marketing_reporter.infrastructure.platforms.naver_blog.service import
 
 FIXTURE_DIR = Path(__file__).parent.parent / "fixtures"
 SCREENSHOT_DIR = Path(__file__).parent.parent / "screenshots"
+SEARCH_URL_PREFIX = "https://search.naver.com/search.naver?"
+# 저장된 HTML은 이미 렌더링된 결과이므로 레이아웃에 필요한 요청만 허용합니다.
+ESSENTIAL_RESOURCE_TYPES = frozenset({"document", "stylesheet"})
+
+EXPECTED_FOUND_URLS = frozenset(
+    {
+        "https://m.blog.naver.com/ghzigc3833z7/223918882395",
+        "https://blog.naver.com/yjn1221/223983155229",
+        "https://blog.naver.com/jiyea_junjin/223908006151",
+    }
+)
+EXPECTED_LESS_THAN_10_FOUND_URLS = frozenset(
+    {
+        "https://blog.naver.com/genycho/223734017762",
+        "https://blog.naver.com/jeremiahjun/223993755718",
+        "https://blog.naver.com/bkpark777/223944594259",
+    }
+)
 
 
-@pytest.fixture
+def is_search_url(url: str) -> bool:
+    """네이버 검색 페이지 요청인지 정규식 없이 접두사로 판별합니다."""
+    return url.startswith(SEARCH_URL_PREFIX)
+
+
+async def block_nonessential_resources(route: Route):
+    """이미지, 스크립트, 폰트 등 테스트에 필요 없는 요청을 차단합니다.
+
+    Playwright는 나중에 등록된 라우트를 먼저 적용하므로, 검색 페이지 라우트보다
+    먼저 등록해야 합니다.
+    """
+    if route.request.resource_type in ESSENTIAL_RESOURCE_TYPES:
+        await route.fallback()
+    else:
+        await route.abort()
+
+
+def fulfill_html(body: str) -> Callable[[Route], Awaitable[None]]:
+    """요청을 주어진 HTML로 응답하는 라우트 핸들러를 만듭니다."""
+
+    async def handle_route(route: Route):
+        await route.fulfill(body=body, content_type="text/html; charset=utf-8")
+
+    return handle_route
+
+
+@pytest.fixture(scope="session")
 def naver_blog_search_html() -> str:
     return (FIXTURE_DIR / "naver_blog_search_result.html").read_text(encoding="utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def naver_blog_search_no_result_html() -> str:
     return (FIXTURE_DIR / "naver_blog_search_no_result.html").read_text(
         encoding="utf-8"
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def naver_blog_search_less_than_10_result_html() -> str:
     return (FIXTURE_DIR / "naver_blog_search_less_than_10.html").read_text(
         encoding="utf-8"
@@ -39,27 +83,16 @@ async def test_finds_specific_posts_from_html_fixture(
     output_dir = SCREENSHOT_DIR
     index = 1
     keyword = Keyword(text="식사대용 쉐이크")
-    posts_to_find = [
+    posts_to_find = (
         Post(url="https://m.blog.naver.com/ghzigc3833z7/223918882395"),
         Post(url="https://blog.naver.com/yjn1221/223983155229"),
         Post(url="https://blog.naver.com/jiyea_junjin/223908006151"),
         Post(url="https://blog.naver.com/theboni/224013165053"),
-    ]
-    expected_found_urls = {
-        "https://m.blog.naver.com/ghzigc3833z7/223918882395",
-        "https://blog.naver.com/yjn1221/223983155229",
-        "https://blog.naver.com/jiyea_junjin/223908006151",
-    }
+    )
     expected_screenshot_path = output_dir / "1_식사대용_쉐이크.png"
 
-    search_url_pattern = re.compile(r"https://search\.naver\.com/search\.naver\?.*")
-
-    async def handle_route(route: Route):
-        await route.fulfill(
-            body=naver_blog_search_html, content_type="text/html; charset=utf-8"
-        )
-
-    await page.route(search_url_pattern, handle_route)
+    await page.route("**/*", block_nonessential_resources)
+    await page.route(is_search_url, fulfill_html(naver_blog_search_html), times=1)
 
     service = PlaywrightNaverBlogService(page=page)
     result = await service.search_and_find_posts(
@@ -71,8 +104,7 @@ async def test_finds_specific_posts_from_html_fixture(
 
     assert result is not None
     assert len(result.found_posts) == 3
-    actual_found_urls = {post.url for post in result.found_posts}
-    assert actual_found_urls == expected_found_urls
+    assert frozenset(post.url for post in result.found_posts) == EXPECTED_FOUND_URLS
     assert result.screenshot is not None
     assert Path(result.screenshot.file_path) == expected_screenshot_path
     assert expected_screenshot_path.exists()
@@ -84,17 +116,12 @@ async def test_no_results_found(
     """검색 결과가 없는 페이지에서 아무것도 찾지 않고 스크린샷도 생성하지 않는지 검증합니다."""
     output_dir = SCREENSHOT_DIR
     keyword = Keyword(text="MABBDDASD")
-    posts_to_find = [Post(url="https://blog.naver.com/some/post")]
-
-    search_url_pattern = re.compile(r"https://search\.naver\.com/search\.naver\?.*")
+    posts_to_find = (Post(url="https://blog.naver.com/some/post"),)
 
-    async def handle_route(route: Route):
-        await route.fulfill(
-            body=naver_blog_search_no_result_html,
-            content_type="text/html; charset=utf-8",
-        )
-
-    await page.route(search_url_pattern, handle_route)
+    await page.route("**/*", block_nonessential_resources)
+    await page.route(
+        is_search_url, fulfill_html(naver_blog_search_no_result_html), times=1
+    )
 
     service = PlaywrightNaverBlogService(page=page)
     result = await service.search_and_find_posts(
@@ -113,28 +140,20 @@ async def test_less_than_10_results_found(
     """10개 미만의 검색 결과에서도 정확히 포스트를 찾아내는지 검증합니다."""
     output_dir = SCREENSHOT_DIR
     keyword = Keyword(text="playwright 동시성 문제")
-    posts_to_find = [
+    posts_to_find = (
         Post(url="https://blog.naver.com/genycho/223734017762"),
         Post(url="https://blog.naver.com/jeremiahjun/223993755718"),
         Post(url="https://blog.naver.com/bkpark777/223944594259"),
         Post(url="https://blog.naver.com/nonexistent/post"),
-    ]
-    expected_found_urls = {
-        "https://blog.naver.com/genycho/223734017762",
-        "https://blog.naver.com/jeremiahjun/223993755718",
-        "https://blog.naver.com/bkpark777/223944594259",
-    }
+    )
     expected_screenshot_path = output_dir / "1_playwright_동시성_문제.png"
 
-    search_url_pattern = re.compile(r"https://search\.naver\.com/search\.naver\?.*")
-
-    async def handle_route(route: Route):
-        await route.fulfill(
-            body=naver_blog_search_less_than_10_result_html,
-            content_type="text/html; charset=utf-8",
-        )
-
-    await page.route(search_url_pattern, handle_route)
+    await page.route("**/*", block_nonessential_resources)
+    await page.route(
+        is_search_url,
+        fulfill_html(naver_blog_search_less_than_10_result_html),
+        times=1,
+    )
 
     service = PlaywrightNaverBlogService(page=page)
     result = await service.search_and_find_posts(
@@ -146,8 +165,10 @@ async def test_less_than_10_results_found(
 
     assert result is not None
     assert len(result.found_posts) == 3
-    actual_found_urls = {post.url for post in result.found_posts}
-    assert actual_found_urls == expected_found_urls
+    assert (
+        frozenset(post.url for post in result.found_posts)
+        == EXPECTED_LESS_THAN_10_FOUND_URLS
+    )
     assert result.screenshot is not None
     assert Path(result.screenshot.file_path) == expected_screenshot_path
     assert expected_screenshot_path.exists()
\ No newline at end of file
@@ -1,21 +1,54 @@
-from playwright.sync_api import sync_playwright
-
-# 1. 설정
-SEARCH_KEYWORD = "playwright 동시성 문제"
-OUTPUT_FILE = "tests/fixtures/naver_blog_search_less_than_10.html"
-
-# 2. Playwright 실행
-with sync_playwright() as p:
-    browser = p.chromium.launch()
-    page = browser.new_page()
-    
-    # 네이버 검색
-    url = f"https://search.naver.com/search.naver?ssc=tab.blog.all&sm=tab_jum&query={SEARCH_KEYWORD}"
-    page.goto(url, wait_until="networkidle")
-    
-    # HTML 저장
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        f.write(page.content())
-    
-    browser.close()
-    print(f"성공적으로 '{OUTPUT_FILE}'에 저장했습니다.")
+import asyncio
+
+from playwright.async_api import Browser, TimeoutError, async_playwright
+
+# 1. 설정: (검색 키워드, 저장할 파일)
+FIXTURES = [
+    ("식사대용 쉐이크", "tests/fixtures/naver_blog_search_result.html"),
+    ("MABBDDASD", "tests/fixtures/naver_blog_search_no_result.html"),
+    ("playwright 동시성 문제", "tests/fixtures/naver_blog_search_less_than_10.html"),
+]
+
+
+async def _capture(browser: Browser, keyword: str, output_file: str) -> None:
+    """하나의 키워드를 별도 컨텍스트에서 검색하고 HTML을 저장합니다."""
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+
+        # 네이버 검색
+        url = f"https://search.naver.com/search.naver?ssc=tab.blog.all&sm=tab_jum&query={keyword}"
+        await page.goto(url, wait_until="domcontentloaded")
+
+        # networkidle 대신 검색 결과 요소가 렌더링될 때까지만 기다립니다.
+        # 검색 결과가 없는 키워드는 타임아웃 후 그대로 저장합니다.
+        try:
+            await page.wait_for_selector(
+                "[data-template-id='ugcItem']", timeout=5000
+            )
+        except TimeoutError:
+            pass
+
+        # HTML 저장
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(await page.content())
+    finally:
+        await context.close()
+
+    print(f"성공적으로 '{output_file}'에 저장했습니다.")
+
+
+async def main() -> None:
+    # 2. 하나의 브라우저에서 모든 키워드를 동시에 수집합니다.
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        try:
+            await asyncio.gather(
+                *[_capture(browser, keyword, path) for keyword, path in FIXTURES]
+            )
+        finally:
+            await browser.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
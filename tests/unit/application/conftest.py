@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import pytest
+
+from viral_marketing_reporter.domain.model import (
+    Keyword,
+    Platform,
+    Post,
+    SearchResult,
+)
+from viral_marketing_reporter.infrastructure.context import ApplicationContext
+from viral_marketing_reporter.infrastructure.platforms.base import SearchPlatformService
+from viral_marketing_reporter.infrastructure.platforms.factory import (
+    PlatformServiceFactory,
+)
+
+from fakes import EMPTY_SEARCH_RESULT
+
+
+class StubSearchPlatformService(SearchPlatformService):
+    """항상 주어진 검색 결과를 반환하는 서비스."""
+
+    def __init__(self, result: SearchResult = EMPTY_SEARCH_RESULT) -> None:
+        self._result: SearchResult = result
+
+    async def search_and_find_posts(
+        self,
+        index: int,
+        keyword: Keyword,
+        posts_to_find: tuple[Post, ...],
+        output_dir: Path,
+        screenshot_all_posts: bool = False,
+    ) -> SearchResult:
+        return self._result
+
+
+class StubPlatformServiceFactory(PlatformServiceFactory):
+    """브라우저 없이 StubSearchPlatformService를 제공하는 팩토리."""
+
+    def __init__(self, service: SearchPlatformService | None = None) -> None:
+        # 브라우저를 띄우지 않은 컨텍스트로 초기화해 상속받은 메서드도 동작하게 합니다.
+        super().__init__(ApplicationContext())
+        self._service: SearchPlatformService = (
+            service or StubSearchPlatformService()
+        )
+
+    async def prepare_platforms(self, platforms: set[Platform]) -> None:
+        pass
+
+    async def get_service(self, platform: Platform) -> SearchPlatformService:
+        return self._service
+
+
+@pytest.fixture
+def search_result() -> SearchResult:
+    """fake_factory의 서비스가 반환할 검색 결과. 테스트에서 parametrize로 바꿀 수 있습니다."""
+    return EMPTY_SEARCH_RESULT
+
+
+@pytest.fixture
+def fake_factory(search_result: SearchResult) -> PlatformServiceFactory:
+    """search_result를 반환하는 서비스를 제공하는 PlatformServiceFactory."""
+    return StubPlatformServiceFactory(StubSearchPlatformService(search_result))
@@ -0,0 +1,3 @@
+from viral_marketing_reporter.domain.model import SearchResult
+
+EMPTY_SEARCH_RESULT = SearchResult(found_posts=(), screenshot=None)
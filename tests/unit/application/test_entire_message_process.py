@@ -2,12 +2,8 @@ from __future__ import annotations
 
 import uuid
 from collections import defaultdict, deque
-from typing import override
 
-import pytest
-from pytest_mock import MockerFixture
-
-from viral_marketing_reporter import bootstrap
+from viral_marketing_reporter.application import handlers
 from viral_marketing_reporter.application.commands import (
     Command,
     CreateSearchCommand,
@@ -26,10 +22,8 @@ from viral_marketing_reporter.domain.model import (
     JobStatus,
     Platform,
     SearchJob,
-    SearchResult,
 )
 from viral_marketing_reporter.infrastructure.message_bus import InMemoryMessageBus
-from viral_marketing_reporter.infrastructure.platforms.base import SearchPlatformService
 from viral_marketing_reporter.infrastructure.platforms.factory import (
     PlatformServiceFactory,
 )
@@ -57,32 +51,55 @@ class FakeQueueMessageBus(MessageBus):
         if not self.queue:
             return
         message = self.queue.popleft()
-        if type(message) in self._command_handlers:
-            await self._command_handlers[type(message)].handle(message)
-        elif type(message) in self._event_handlers:
-            for handler in self._event_handlers[type(message)]:
+        message_type = type(message)
+        command_handler = self._command_handlers.get(message_type)
+        if command_handler is not None:
+            await command_handler.handle(message)
+            return
+        event_handlers = self._event_handlers.get(message_type)
+        if event_handlers is not None:
+            for handler in event_handlers:
                 await handler.handle(message)
-        else:
-            raise ValueError(f"No handler for {type(message)}")
+            return
+        raise ValueError(f"No handler for {message_type}")
+
+    async def drain(self):
+        while self.queue:
+            await self.run_once()
+
+
+def _register_handlers(
+    bus: MessageBus, uow: InMemoryUnitOfWork, factory: PlatformServiceFactory
+) -> None:
+    """bootstrap과 같은 핸들러들을 주어진 bus에 등록합니다."""
+    bus.register_command(
+        CreateSearchCommand, handlers.CreateSearchCommandHandler(uow=uow)
+    )
+    bus.register_command(
+        ExecuteSearchTaskCommand,
+        handlers.ExecuteSearchTaskCommandHandler(uow=uow, factory=factory),
+    )
+    bus.subscribe_to_event(
+        SearchJobCreated, handlers.SearchJobCreatedHandler(uow=uow, factory=factory)
+    )
+    bus.subscribe_to_event(
+        SearchJobStarted, handlers.SearchJobStartedHandler(uow=uow, bus=bus)
+    )
+    bus.subscribe_to_event(TaskCompleted, handlers.TaskCompletedHandler(uow=uow))
+    bus.subscribe_to_event(JobCompleted, handlers.JobCompletedHandler(uow=uow))
 
 
 # Integration Test
 
 
-@pytest.mark.asyncio
-async def test_full_process_manager_flow(mocker: MockerFixture):
+async def test_full_process_manager_flow(
+    fake_factory: PlatformServiceFactory,
+):
     # Arrange
     bus = FakeQueueMessageBus()
     uow = InMemoryUnitOfWork(bus)
 
-    factory = mocker.AsyncMock(spec=PlatformServiceFactory)
-    fake_service = mocker.AsyncMock(spec=SearchPlatformService)
-    fake_service.search_and_find_posts.return_value = SearchResult(
-        found_posts=[], screenshot=None
-    )
-    factory.get_service.return_value = fake_service
-
-    bootstrap.bootstrap(uow=uow, bus=bus, factory=factory)
+    _register_handlers(bus, uow, fake_factory)
 
     # Act & Assert
     job_id = uuid.uuid4()
@@ -124,20 +141,39 @@ async def test_full_process_manager_flow(mocker: MockerFixture):
     assert saved_job.status == JobStatus.COMPLETED
 
 
-@pytest.mark.asyncio
-async def test_full_process_manager_flow_with_in_memory_bus(mocker: MockerFixture):
+async def test_full_process_manager_flow_drained(
+    fake_factory: PlatformServiceFactory,
+):
     # Arrange
-    bus = InMemoryMessageBus()
+    bus = FakeQueueMessageBus()
     uow = InMemoryUnitOfWork(bus)
 
-    factory = mocker.AsyncMock(spec=PlatformServiceFactory)
-    fake_service = mocker.AsyncMock(spec=SearchPlatformService)
-    fake_service.search_and_find_posts.return_value = SearchResult(
-        found_posts=[], screenshot=None
+    _register_handlers(bus, uow, fake_factory)
+
+    # Act
+    job_id = uuid.uuid4()
+    await bus.handle(
+        CreateSearchCommand(
+            job_id=job_id,
+            tasks=[TaskDTO(index=1, keyword="k1", urls=[], platform=Platform.NAVER_BLOG)],
+        )
     )
-    factory.get_service.return_value = fake_service
+    await bus.drain()
+
+    # Assert
+    saved_job = await uow.search_jobs.get(job_id)
+    assert saved_job is not None
+    assert saved_job.status == JobStatus.COMPLETED
+
+
+async def test_full_process_manager_flow_with_in_memory_bus(
+    fake_factory: PlatformServiceFactory,
+):
+    # Arrange
+    bus = InMemoryMessageBus()
+    uow = InMemoryUnitOfWork(bus)
 
-    bootstrap.bootstrap(uow=uow, bus=bus, factory=factory)
+    _register_handlers(bus, uow, fake_factory)
 
     # Act & Assert
     job_id = uuid.uuid4()
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import uuid
-from typing import override
 
 import pytest
 from pytest_mock import MockerFixture
@@ -31,6 +30,7 @@ from viral_marketing_reporter.domain.model import (
     JobStatus,
     Keyword,
     Platform,
+    Post,
     SearchJob,
     SearchResult,
     SearchTask,
@@ -39,48 +39,49 @@ from viral_marketing_reporter.domain.model import (
 from viral_marketing_reporter.domain.repositories import SearchJobRepository
 from viral_marketing_reporter.domain.uow import UnitOfWork
 from viral_marketing_reporter.infrastructure import message_bus
-from viral_marketing_reporter.infrastructure.platforms.base import SearchPlatformService
 from viral_marketing_reporter.infrastructure.platforms.factory import (
     PlatformServiceFactory,
 )
 from viral_marketing_reporter.infrastructure.repositories import (
-    in_memory_repository_factory,
+    InMemorySearchJobRepository,
 )
 
+from fakes import EMPTY_SEARCH_RESULT
+
 
 class FakeUnitOfWork(UnitOfWork):
     def __init__(self):
-        self.search_jobs: SearchJobRepository = in_memory_repository_factory()
+        # 전역 싱글톤 대신 테스트마다 새 저장소를 사용합니다.
+        self.search_jobs: SearchJobRepository = InMemorySearchJobRepository()
         self.committed: bool = False
         self.events: list[Event] = []
 
-    @override
     async def __aenter__(self) -> FakeUnitOfWork:
         self.committed = False
         self.events.clear()
         return self
 
-    @override
     async def __aexit__(self, exc_type, exc_val, traceback):  # pyright: ignore[reportUnknownParameterType, reportMissingParameterType]
         pass
 
-    @override
     async def commit(self):
         for job in self.search_jobs.seen:
             self.events.extend(job.pull_events())
         self.committed = True
 
-    @override
     async def rollback(self):
         pass
 
 
+@pytest.fixture
+def uow() -> FakeUnitOfWork:
+    return FakeUnitOfWork()
+
+
 # Unit Tests
 
 
-@pytest.mark.asyncio
-async def test_create_search_command_handler_creates_job():
-    uow = FakeUnitOfWork()
+async def test_create_search_command_handler_creates_job(uow: FakeUnitOfWork):
     handler = CreateSearchCommandHandler(uow=uow)
     job_id = uuid.uuid4()
     command = CreateSearchCommand(
@@ -97,9 +98,7 @@ async def test_create_search_command_handler_creates_job():
     assert uow.events[0].job_id == job_id
 
 
-@pytest.mark.asyncio
-async def test_search_job_created_handler_starts_job():
-    uow = FakeUnitOfWork()
+async def test_search_job_created_handler_starts_job(uow: FakeUnitOfWork):
     handler = SearchJobCreatedHandler(uow=uow)
     job_id = uuid.uuid4()
     job = SearchJob.create(job_id=job_id, tasks=[])
@@ -118,9 +117,9 @@ async def test_search_job_created_handler_starts_job():
     assert isinstance(uow.events[0], SearchJobStarted)
 
 
-@pytest.mark.asyncio
-async def test_search_job_started_handler_dispatches_commands(mocker: MockerFixture):
-    uow = FakeUnitOfWork()
+async def test_search_job_started_handler_dispatches_commands(
+    uow: FakeUnitOfWork, mocker: MockerFixture
+):
     bus = message_bus.InMemoryMessageBus()
     spy_handle = mocker.spy(bus, "handle")
     handler = SearchJobStartedHandler(uow=uow, bus=bus)
@@ -135,7 +134,7 @@ async def test_search_job_started_handler_dispatches_commands(mocker: MockerFixt
     task = SearchTask(
         index=1,
         keyword=Keyword(text="k1"),
-        blog_posts_to_find=[],
+        blog_posts_to_find=(),
         platform=Platform.NAVER_BLOG,
     )
     job = SearchJob(tasks=[task])
@@ -151,27 +150,35 @@ async def test_search_job_started_handler_dispatches_commands(mocker: MockerFixt
     assert dispatched_command.task_id == task.task_id
 
 
-@pytest.mark.asyncio
-async def test_execute_search_task_handler_updates_job(mocker: MockerFixture):
-    uow = FakeUnitOfWork()
-    factory = mocker.AsyncMock(spec=PlatformServiceFactory)
-    fake_service = mocker.AsyncMock(spec=SearchPlatformService)
-    fake_service.search_and_find_posts.return_value = SearchResult(  # pyright: ignore[reportAny]
-        found_posts=[], screenshot=None
-    )
-    factory.get_service.return_value = fake_service  # pyright: ignore[reportAny]
-
+@pytest.mark.parametrize(
+    ("search_result", "expected_status"),
+    [
+        (EMPTY_SEARCH_RESULT, TaskStatus.NOT_FOUND),
+        (
+            SearchResult(
+                found_posts=(Post(url="https://blog.naver.com/user/1"),),
+                screenshot=None,
+            ),
+            TaskStatus.FOUND,
+        ),
+    ],
+)
+async def test_execute_search_task_handler_updates_job(
+    uow: FakeUnitOfWork,
+    fake_factory: PlatformServiceFactory,
+    expected_status: TaskStatus,
+):
     task = SearchTask(
         index=1,
         keyword=Keyword(text="k1"),
-        blog_posts_to_find=[],
+        blog_posts_to_find=(),
         platform=Platform.NAVER_BLOG,
     )
     job = SearchJob(tasks=[task])
     await uow.search_jobs.add(job)
     await uow.commit()
 
-    handler = ExecuteSearchTaskCommandHandler(uow=uow, factory=factory)
+    handler = ExecuteSearchTaskCommandHandler(uow=uow, factory=fake_factory)
     command = ExecuteSearchTaskCommand(job_id=job.job_id, task_id=task.task_id)
 
     await handler.handle(command)
@@ -179,31 +186,31 @@ async def test_execute_search_task_handler_updates_job(mocker: MockerFixture):
     assert uow.committed is True
     saved_job = await uow.search_jobs.get(job.job_id)
     assert saved_job is not None
-    assert saved_job.tasks[0].status == TaskStatus.NOT_FOUND
+    assert saved_job.tasks[0].status == expected_status
     assert len(uow.events) == 1
     assert isinstance(uow.events[0], TaskCompleted)
 
 
-@pytest.mark.asyncio
-async def test_task_completed_handler_marks_job_as_completed():
-    uow = FakeUnitOfWork()
+async def test_task_completed_handler_marks_job_as_completed(
+    uow: FakeUnitOfWork,
+):
     handler = TaskCompletedHandler(uow=uow)
 
     task1 = SearchTask(
         index=1,
         keyword=Keyword(text="k1"),
-        blog_posts_to_find=[],
+        blog_posts_to_find=(),
         platform=Platform.NAVER_BLOG,
     )
     task2 = SearchTask(
         index=2,
         keyword=Keyword(text="k2"),
-        blog_posts_to_find=[],
+        blog_posts_to_find=(),
         platform=Platform.NAVER_BLOG,
     )
     job = SearchJob(tasks=[task1, task2])
-    job.update_task_result(task1.task_id, SearchResult(found_posts=[], screenshot=None))
-    job.update_task_result(task2.task_id, SearchResult(found_posts=[], screenshot=None))
+    job.update_task_result(task1.task_id, EMPTY_SEARCH_RESULT)
+    job.update_task_result(task2.task_id, EMPTY_SEARCH_RESULT)
     await uow.search_jobs.add(job)
     await uow.commit()
 